@@ -8,7 +8,9 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-if __name__ == "__main__":
+
+def _serve():
+    """Load settings and start the uvicorn server."""
     import uvicorn
 
     from src.config import settings
@@ -29,4 +31,17 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # uvloop is not available on Windows; reload (debug) mode keeps the
+        # stock asyncio loop so asyncio's debugging aids behave as usual
+        loop=(
+            "asyncio"
+            if settings.debug or sys.platform == "win32"
+            else "uvloop"
+        ),
+        http="httptools",
+        log_level=settings.log_level.lower(),
     )
+
+
+if __name__ == "__main__":
+    _serve()
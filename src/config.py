@@ -1,8 +1,14 @@
 """
 Application configuration using Pydantic settings.
 This handles environment variables and application settings.
+
+``pydantic_settings`` is imported with this module so ``Settings`` can be
+imported, used in type hints and built with overrides in tests. The shared
+instance is built (and ``.env`` read) on the first call to ``get_settings()``
+or first access to ``settings``; importing the API app does this at startup.
 """
 
+from functools import lru_cache
 from typing import List
 
 from pydantic_settings import BaseSettings
@@ -25,10 +31,12 @@ class Settings(BaseSettings):
     google_api_key: str = ""
     openai_api_key: str = ""
     huggingface_api_key: str = ""
+    ai_response_cache_size: int = 128
 
     # File Upload
     max_file_size_mb: int = 10
     upload_dir: str = "./uploads"
+    upload_cache_size: int = 1024
     allowed_file_types: List[str] = ["pdf"]
 
     # Security
@@ -53,5 +61,14 @@ class Settings(BaseSettings):
         return bool(self.google_api_key or self.openai_api_key)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the application settings once and return the cached instance."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Resolve the global ``settings`` instance on first access."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,8 @@ external frameworks.
 
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import cached_property
 from typing import List, Optional
 
 
@@ -19,16 +20,25 @@ class MatchStatus(Enum):
     FAILED = "failed"
 
 
-class SkillLevel(Enum):
-    """Skill proficiency levels."""
+class SkillLevel(IntEnum):
+    """
+    Skill proficiency levels.
+    Ordered by proficiency, so levels compare directly
+    (e.g. ``cv_level >= required_level``).
+    """
 
-    BEGINNER = "beginner"
-    INTERMEDIATE = "intermediate"
-    ADVANCED = "advanced"
-    EXPERT = "expert"
+    BEGINNER = 0
+    INTERMEDIATE = 1
+    ADVANCED = 2
+    EXPERT = 3
 
+    @property
+    def label(self) -> str:
+        """Lowercase name used in AI payloads and API responses."""
+        return self.name.lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class Skill:
     """Represents a skill with proficiency level."""
 
@@ -39,7 +49,7 @@ class Skill:
     category: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     """Represents educational background."""
 
@@ -50,7 +60,7 @@ class Education:
     gpa: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Experience:
     """Represents work experience."""
 
@@ -63,6 +73,7 @@ class Experience:
     end_date: Optional[datetime] = None
 
 
+# Not slotted: cached_property stores its values in the instance __dict__.
 @dataclass
 class CV:
     """Core CV entity containing all extracted information."""
@@ -97,20 +108,28 @@ class CV:
         if self.languages is None:
             self.languages = []
 
-    @property
+    @cached_property
     def total_experience_years(self) -> float:
-        """Calculate total years of experience."""
+        """
+        Calculate total years of experience.
+        Cached per instance; ``del cv.total_experience_years`` after
+        changing ``experience`` to recompute.
+        """
         if not self.experience:
             return 0.0
         return sum(exp.duration_months for exp in self.experience) / 12.0
 
-    @property
+    @cached_property
     def skill_names(self) -> List[str]:
-        """Get list of skill names."""
+        """
+        Get list of skill names.
+        Cached per instance; ``del cv.skill_names`` after changing
+        ``skills`` to recompute.
+        """
         return [skill.name for skill in self.skills] if self.skills else []
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRequirement:
     """Represents a specific job requirement."""
 
@@ -120,6 +139,7 @@ class JobRequirement:
     weight: float = 1.0  # Importance weight for scoring
 
 
+# Not slotted: cached_property stores its values in the instance __dict__.
 @dataclass
 class Job:
     """Core Job entity containing job description analysis."""
@@ -150,18 +170,26 @@ class Job:
         if self.required_certifications is None:
             self.required_certifications = []
 
-    @property
+    @cached_property
     def all_required_skill_names(self) -> List[str]:
-        """Get all required skill names."""
+        """
+        Get all required skill names.
+        Cached per instance; ``del job.all_required_skill_names`` after
+        changing ``required_skills`` to recompute.
+        """
         return (
             [req.skill for req in self.required_skills]
             if self.required_skills
             else []
         )
 
-    @property
+    @cached_property
     def mandatory_skills(self) -> List[JobRequirement]:
-        """Get only mandatory skills."""
+        """
+        Get only mandatory skills.
+        Cached per instance; ``del job.mandatory_skills`` after changing
+        ``required_skills`` to recompute.
+        """
         return (
             [req for req in self.required_skills if req.is_mandatory]
             if self.required_skills
@@ -169,7 +197,7 @@ class Job:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMatch:
     """Represents how well a CV skill matches a job requirement."""
 
@@ -181,7 +209,7 @@ class SkillMatch:
     gap_analysis: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchAnalysis:
     """Detailed analysis of how well a CV matches a job."""
 
@@ -217,7 +245,7 @@ class MatchAnalysis:
             self.interview_tips = []
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Main entity representing a CV-Job matching session."""
 
@@ -3,8 +3,9 @@ Domain services containing core business logic.
 These services orchestrate complex business operations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from ..entities import CV, Job, MatchAnalysis
 
@@ -27,6 +28,20 @@ class AIAnalysisService(ABC):
         """Calculate comprehensive match analysis between CV and job."""
         pass
 
+    async def calculate_match_scores(
+        self, pairs: List[Tuple[CV, Job]]
+    ) -> List[MatchAnalysis]:
+        """
+        Calculate match analyses for several CV-Job pairs.
+        Scores the pairs concurrently by default; implementations can
+        override this to batch them into a single AI request.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.calculate_match_score(cv, job) for cv, job in pairs)
+            )
+        )
+
 
 class PDFProcessingService(ABC):
     """Abstract service for PDF processing operations."""
@@ -37,8 +52,15 @@ class PDFProcessingService(ABC):
         pass
 
     @abstractmethod
-    async def validate_pdf_file(self, file_content: bytes) -> bool:
-        """Validate if the file is a proper PDF."""
+    async def validate_pdf_file(
+        self, file_content: bytes, strict: bool = False
+    ) -> bool:
+        """Validate if the file is a proper PDF, fully parsing it if strict."""
+        pass
+
+    @abstractmethod
+    async def process(self, file_content: bytes) -> Tuple[bool, str]:
+        """Validate a PDF and extract its text, returning (is_valid, text)."""
         pass
 
 
@@ -60,15 +82,89 @@ class MatchingService:
 
         return analysis
 
+    async def create_match_analyses(
+        self, cvs: List[CV], job: Job
+    ) -> List[MatchAnalysis]:
+        """
+        Create match analyses for several CVs against the same job,
+        e.g. to rank candidates. Results are in the same order as ``cvs``.
+        """
+        analyses = await self.ai_service.calculate_match_scores(
+            [(cv, job) for cv in cvs]
+        )
+
+        return self.batch_apply_business_rules(analyses, cvs, job)
+
+    def batch_apply_business_rules(
+        self, analyses: List[MatchAnalysis], cvs: List[CV], job: Job
+    ) -> List[MatchAnalysis]:
+        """
+        Apply the same rules as _apply_business_rules to many analyses of
+        one job, scoring all CVs at once with NumPy array operations.
+        """
+        import numpy as np
+
+        count = len(analyses)
+        if not count:
+            return analyses
+
+        mandatory_skills = [req.skill for req in job.mandatory_skills]
+        scores = np.fromiter(
+            (analysis.overall_score for analysis in analyses),
+            dtype=np.float64,
+            count=count,
+        )
+        missing = np.fromiter(
+            (self._count_missing(mandatory_skills, cv) for cv in cvs),
+            dtype=np.float64,
+            count=count,
+        )
+        years = np.fromiter(
+            (cv.total_experience_years for cv in cvs),
+            dtype=np.float64,
+            count=count,
+        )
+
+        # Rule 1: Penalize 10% for each missing mandatory skill
+        scores = np.where(
+            missing > 0, np.maximum(0, scores - missing * 0.1 * 100), scores
+        )
+
+        # Rule 2: Boost score for relevant experience
+        exp_diff = years - job.min_experience_years
+        boost = np.minimum(0.1, exp_diff * 0.02)
+        scores = np.where(
+            exp_diff >= 0, np.minimum(100, scores + boost * 100), scores
+        )
+
+        # Rule 3: Add specific recommendations based on gaps
+        for analysis, cv, score in zip(analyses, cvs, scores.tolist()):
+            analysis.overall_score = score
+            analysis.recommendations.extend(
+                self._generate_recommendations(cv, job, analysis)
+            )
+
+        return analyses
+
+    @staticmethod
+    def _count_missing(mandatory_skills: List[str], cv: CV) -> int:
+        """Count mandatory skills that the CV does not list."""
+        cv_skill_set = frozenset(skill.name for skill in cv.skills or [])
+        return sum(
+            1 for skill in mandatory_skills if skill not in cv_skill_set
+        )
+
     def _apply_business_rules(
         self, analysis: MatchAnalysis, cv: CV, job: Job
     ) -> MatchAnalysis:
         """Apply business rules to refine the analysis."""
 
+        cv_skill_set = frozenset(skill.name for skill in cv.skills or [])
+
         # Rule 1: Penalize if missing mandatory skills
         mandatory_skills = [req.skill for req in job.mandatory_skills]
         missing_mandatory = [
-            skill for skill in mandatory_skills if skill not in cv.skill_names
+            skill for skill in mandatory_skills if skill not in cv_skill_set
         ]
 
         if missing_mandatory:
@@ -115,7 +211,7 @@ class MatchingService:
 
         # Education recommendations
         if job.required_education and cv.education:
-            cv_degrees = [edu.degree.lower() for edu in cv.education]
+            cv_degrees = frozenset(edu.degree.lower() for edu in cv.education)
             missing_education = [
                 edu
                 for edu in job.required_education
@@ -3,50 +3,63 @@ AI service implementation using Google Gemini.
 This service provides AI-powered analysis for CV and job matching.
 """
 
-import json
+import hashlib
 import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
-import google.generativeai as genai
-
-from ...config import settings
-from ...domain.entities import (
-    CV,
-    Education,
-    Experience,
-    Job,
-    JobRequirement,
-    MatchAnalysis,
-    Skill,
-    SkillLevel,
-)
+import orjson
+
+from ...config import get_settings
+from ...domain.entities import CV, Job, MatchAnalysis
 from ...domain.services import AIAnalysisService
-from .converters import (
-    convert_to_cv_entity,
-    convert_to_job_entity,
-    convert_to_match_analysis,
-)
-from .prompts import (
-    create_cv_extraction_prompt,
-    create_job_analysis_prompt,
-    create_matching_prompt,
-)
+from ..cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Gemini usually wraps its JSON in a ```json fenced block.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+@lru_cache(maxsize=1)
+def _get_response_cache() -> LRUCache:
+    """
+    Successfully parsed Gemini responses keyed by prompt digest, so repeated
+    analyses of the same input skip the API round-trip and save quota.
+    Created on first use so importing this module does not read settings.
+    """
+    return LRUCache(get_settings().ai_response_cache_size)
+
 
 class GeminiAIService(AIAnalysisService):
     """AI service implementation using Google Gemini."""
 
     def __init__(self):
+        settings = get_settings()
         if not settings.google_api_key:
             raise ValueError("Google API key not configured")
 
-        genai.configure(api_key=settings.google_api_key)
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+        # Imported here because the SDK pulls in gRPC and protobuf, which
+        # is costly for code paths that never talk to Gemini.
+        import google.generativeai as genai
+
+        self._genai = genai
+        self._genai.configure(api_key=settings.google_api_key)
+        # JSON mode makes Gemini return bare JSON, so responses can be
+        # parsed directly without extracting them from surrounding prose.
+        self.model = self._genai.GenerativeModel(
+            "gemini-1.5-flash",
+            generation_config={"response_mime_type": "application/json"},
+        )
         logger.info("Initialized Gemini AI service")
 
     async def extract_cv_data(self, raw_text: str) -> CV:
         """Extract structured data from raw CV text using Gemini."""
+        from .converters import convert_to_cv_entity
+        from .prompts import create_cv_extraction_prompt
+
         try:
             prompt = create_cv_extraction_prompt(raw_text)
             response = await self._generate_content(prompt)
@@ -56,16 +69,14 @@ class GeminiAIService(AIAnalysisService):
             if not response:
                 raise AIServiceError("Empty response from AI service")
 
-            # Try to extract JSON from response (sometimes AI adds extra text)
-            response = self._extract_json_from_response(response)
-
-            extracted_data = json.loads(response)
+            extracted_data = self._parse_json_response(response)
 
             cv = convert_to_cv_entity(extracted_data, raw_text)
+            self._cache_response(prompt, response)
             logger.info("Successfully extracted CV data using Gemini")
             return cv
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {str(e)}")
             logger.error(f"Raw response: {response[:500]}...")
             raise AIServiceError(f"Invalid JSON response from AI: {str(e)}")
@@ -75,6 +86,9 @@ class GeminiAIService(AIAnalysisService):
 
     async def analyze_job_description(self, description: str) -> Job:
         """Extract job requirements from description using Gemini."""
+        from .converters import convert_to_job_entity
+        from .prompts import create_job_analysis_prompt
+
         try:
             prompt = create_job_analysis_prompt(description)
             response = await self._generate_content(prompt)
@@ -84,16 +98,14 @@ class GeminiAIService(AIAnalysisService):
             if not response:
                 raise AIServiceError("Empty response from AI service")
 
-            # Try to extract JSON from response
-            response = self._extract_json_from_response(response)
-
-            job_data = json.loads(response)
+            job_data = self._parse_json_response(response)
 
             job = convert_to_job_entity(job_data, description)
+            self._cache_response(prompt, response)
             logger.info("Successfully analyzed job description using Gemini")
             return job
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {str(e)}")
             logger.error(f"Raw response: {response[:500]}...")
             raise AIServiceError(f"Invalid JSON response from AI: {str(e)}")
@@ -103,12 +115,34 @@ class GeminiAIService(AIAnalysisService):
 
     async def calculate_match_score(self, cv: CV, job: Job) -> MatchAnalysis:
         """Calculate comprehensive match analysis using Gemini."""
+        return await self.calculate_match_score_from_primitives(
+            cv.skill_names,
+            cv.total_experience_years,
+            job.all_required_skill_names,
+            job.min_experience_years,
+            cv.id or "unknown",
+            job.id or "unknown",
+        )
+
+    async def calculate_match_score_from_primitives(
+        self,
+        cv_skills: List[str],
+        cv_years: float,
+        job_skills: List[str],
+        job_min_years: int,
+        cv_id: str = "unknown",
+        job_id: str = "unknown",
+    ) -> MatchAnalysis:
+        """
+        Calculate match analysis from the values the matching prompt uses.
+        Lets callers holding raw data skip building CV and Job entities.
+        """
+        from .converters import convert_to_match_analysis
+        from .prompts import create_matching_prompt
+
         try:
             prompt = create_matching_prompt(
-                cv.skill_names,
-                cv.total_experience_years,
-                job.all_required_skill_names,
-                job.min_experience_years,
+                cv_skills, cv_years, job_skills, job_min_years
             )
             response = await self._generate_content(prompt)
 
@@ -117,21 +151,15 @@ class GeminiAIService(AIAnalysisService):
             if not response:
                 raise AIServiceError("Empty response from AI service")
 
-            # Try to extract JSON from response
-            response = self._extract_json_from_response(response)
+            match_data = self._parse_json_response(response)
 
-            match_data = json.loads(response)
-
-            cv_id_str = cv.id or "unknown"
-            job_id_str = job.id or "unknown"
-            analysis = convert_to_match_analysis(
-                match_data, cv_id_str, job_id_str
-            )
+            analysis = convert_to_match_analysis(match_data, cv_id, job_id)
+            self._cache_response(prompt, response)
 
             logger.info("Successfully calculated match score using Gemini")
             return analysis
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {str(e)}")
             logger.error(f"Raw response: {response[:500]}...")
             raise AIServiceError(f"Invalid JSON response from AI: {str(e)}")
@@ -139,86 +167,131 @@ class GeminiAIService(AIAnalysisService):
             logger.error(f"Error calculating match score: {str(e)}")
             raise AIServiceError(f"Failed to calculate match: {str(e)}")
 
+    async def calculate_match_scores(
+        self, pairs: List[Tuple[CV, Job]]
+    ) -> List[MatchAnalysis]:
+        """
+        Calculate match analyses for several CV-Job pairs using a single
+        Gemini request, since the round-trip dominates the cost of a match.
+        """
+        from .converters import convert_to_match_analysis
+        from .prompts import create_batch_matching_prompt
+
+        if not pairs:
+            return []
+
+        try:
+            prompt = create_batch_matching_prompt(
+                [
+                    (
+                        cv.skill_names,
+                        cv.total_experience_years,
+                        job.all_required_skill_names,
+                        job.min_experience_years,
+                    )
+                    for cv, job in pairs
+                ]
+            )
+            response = await self._generate_content(prompt)
+
+            # Clean and validate response
+            response = response.strip()
+            if not response:
+                raise AIServiceError("Empty response from AI service")
+
+            batch_data = self._parse_json_response(response)
+            matches_by_pair = self._index_batch_matches(batch_data)
+
+            # One timestamp for the whole batch
+            now = datetime.now()
+            analyses = []
+            for pair_id, (cv, job) in enumerate(pairs):
+                match_data = matches_by_pair.get(pair_id)
+                if match_data is None:
+                    raise AIServiceError(f"No match result for pair {pair_id}")
+                analyses.append(
+                    convert_to_match_analysis(
+                        match_data,
+                        cv.id or "unknown",
+                        job.id or "unknown",
+                        now=now,
+                    )
+                )
+            self._cache_response(prompt, response)
+
+            logger.info(
+                f"Successfully calculated {len(analyses)} match scores "
+                "using Gemini"
+            )
+            return analyses
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON decode error: {str(e)}")
+            logger.error(f"Raw response: {response[:500]}...")
+            raise AIServiceError(f"Invalid JSON response from AI: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error calculating match scores: {str(e)}")
+            raise AIServiceError(f"Failed to calculate matches: {str(e)}")
+
+    @staticmethod
+    def _index_batch_matches(batch_data: Any) -> Dict[int, dict]:
+        """
+        Map each batch result to its integer pair_id. Accepts either a bare
+        list of results or {"matches": [...]}; entries that aren't objects
+        or whose pair_id isn't an integer are skipped.
+        """
+        if isinstance(batch_data, dict):
+            batch_data = batch_data.get("matches", [])
+        if not isinstance(batch_data, list):
+            return {}
+
+        matches_by_pair = {}
+        for match_data in batch_data:
+            if not isinstance(match_data, dict):
+                continue
+            try:
+                pair_id = int(match_data.get("pair_id"))
+            except (TypeError, ValueError):
+                continue
+            matches_by_pair[pair_id] = match_data
+        return matches_by_pair
+
     async def match_cv_job(self, cv_data: dict, job_data: dict) -> dict:
         """
         Match CV data against job data and return compatibility analysis.
         This method accepts raw CV and job dictionaries from API.
         """
+        from .converters import release_skill_matches
+
         try:
             logger.info("Starting CV-Job matching with raw data")
 
-            # Create CV entity from processed data
-            cv = CV(
-                id=cv_data.get("id"),
-                name=cv_data.get("name"),
-                email=cv_data.get("email"),
-                phone=cv_data.get("phone"),
-                skills=[
-                    Skill(
-                        name=skill.get("name", ""),
-                        level=SkillLevel(
-                            skill.get("level", "beginner").lower()
-                        ),
-                        years_experience=skill.get("years_experience"),
-                        category=skill.get("category"),
-                    )
-                    for skill in cv_data.get("skills", [])
-                ],
-                experience=[
-                    Experience(
-                        position=exp.get("title", ""),
-                        company=exp.get("company", ""),
-                        duration_months=exp.get("duration_months", 0),
-                        description=exp.get("description", ""),
-                        skills_used=exp.get("skills_used", []),
-                    )
+            # Only the fields used by the matching prompt are read, so no
+            # CV or Job entities are built from the raw data.
+            cv_skills = [
+                skill.get("name", "") for skill in cv_data.get("skills", [])
+            ]
+            cv_years = (
+                sum(
+                    exp.get("duration_months", 0)
                     for exp in cv_data.get("work_experience", [])
-                ],
-                education=[
-                    Education(
-                        degree=edu.get("degree", ""),
-                        institution=edu.get("institution", ""),
-                        field_of_study=edu.get("field", ""),
-                        graduation_year=edu.get("year"),
-                    )
-                    for edu in cv_data.get("education", [])
-                ],
+                )
+                / 12.0
             )
-
-            # Create Job entity from processed data
-            job = Job(
-                id=job_data.get("id"),
-                title=job_data.get("title", ""),
-                company=job_data.get("company", ""),
-                description=job_data.get("description", ""),
-                min_experience_years=job_data.get("min_experience_years", 0),
-                required_skills=[
-                    JobRequirement(
-                        skill=skill.get("name", ""),
-                        required_level=SkillLevel(
-                            skill.get("level", "intermediate").lower()
-                        ),
-                        is_mandatory=skill.get("is_mandatory", True),
-                        weight=skill.get("weight", 1.0),
-                    )
-                    for skill in job_data.get("required_skills", [])
-                ],
-                preferred_skills=[
-                    JobRequirement(
-                        skill=skill.get("name", ""),
-                        required_level=SkillLevel(
-                            skill.get("level", "intermediate").lower()
-                        ),
-                        is_mandatory=False,
-                        weight=skill.get("weight", 0.5),
-                    )
-                    for skill in job_data.get("preferred_skills", [])
-                ],
+            job_skills = [
+                skill.get("name", "")
+                for skill in job_data.get("required_skills", [])
+            ]
+
+            match_analysis = await self.calculate_match_score_from_primitives(
+                cv_skills,
+                cv_years,
+                job_skills,
+                job_data.get("min_experience_years", 0),
+                cv_data.get("id") or "unknown",
+                job_data.get("id") or "unknown",
             )
 
-            # Use the existing match calculation method
-            match_analysis = await self.calculate_match_score(cv, job)
-
             # Convert match analysis to dictionary for API response
             result = {
                 "overall_compatibility_score": match_analysis.overall_score,
@@ -228,13 +301,13 @@ class GeminiAIService(AIAnalysisService):
                     {
                         "name": skill.skill_name,
                         "cv_level": (
-                            skill.cv_skill_level.value
-                            if skill.cv_skill_level
+                            skill.cv_skill_level.label
+                            if skill.cv_skill_level is not None
                             else "unknown"
                         ),
                         "job_importance": (
-                            skill.required_level.value
-                            if skill.required_level
+                            skill.required_level.label
+                            if skill.required_level is not None
                             else "unknown"
                         ),
                     }
@@ -246,6 +319,7 @@ class GeminiAIService(AIAnalysisService):
                 ],
                 "recommendations": match_analysis.recommendations or [],
             }
+            release_skill_matches(match_analysis.skill_matches)
 
             logger.info("Successfully completed CV-Job matching")
             return result
@@ -255,24 +329,85 @@ class GeminiAIService(AIAnalysisService):
             raise AIServiceError(f"Failed to match CV and job: {str(e)}")
 
     async def _generate_content(self, prompt: str) -> str:
-        """Generate content using Gemini with error handling."""
+        """
+        Generate content using Gemini with error handling.
+        Returns the cached response instead if this prompt was already
+        answered with valid JSON.
+        """
+        cached = _get_response_cache().get(self._prompt_key(prompt))
+        if cached is not None:
+            logger.debug("Using cached Gemini response")
+            return cached
+
         try:
-            response = self.model.generate_content(prompt)
+            # The async client lets concurrent requests (e.g. gathered
+            # matches) wait on Gemini without blocking the event loop
+            response = await self.model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
             raise AIServiceError(f"Gemini API failed: {str(e)}")
 
+    def _cache_response(self, prompt: str, response: str) -> None:
+        """
+        Remember a response for a prompt. Only call this once the response
+        has been converted successfully, so unusable answers are retried.
+        """
+        _get_response_cache().set(self._prompt_key(prompt), response)
+
+    @staticmethod
+    def _prompt_key(prompt: str) -> bytes:
+        """Return a compact cache key for a prompt."""
+        return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+    def _parse_json_response(self, response: str) -> Any:
+        """
+        Parse the JSON body of an AI response.
+        The model runs in JSON mode, so the response is parsed as is;
+        extracting JSON from surrounding text is only a fallback.
+        """
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            return orjson.loads(self._extract_json_from_response(response))
+
     def _extract_json_from_response(self, response: str) -> str:
-        """Extract JSON from AI response that might contain extra text."""
-        # Look for JSON content between { and }
-        start_idx = response.find("{")
-        end_idx = response.rfind("}")
+        """
+        Extract JSON from AI response that might contain extra text.
+        Returns the first balanced JSON object, ignoring braces that appear
+        inside string values.
+        """
+        # Fast path for the common fenced-block output
+        fenced = _FENCE_RE.search(response)
+        if fenced:
+            return fenced.group(1)
 
-        if start_idx == -1 or end_idx == -1:
+        start_idx = response.find("{")
+        if start_idx == -1:
             raise AIServiceError("No JSON found in AI response")
 
-        return response[start_idx : end_idx + 1]
+        depth = 0
+        in_string = False
+        escape = False
+        for idx in range(start_idx, len(response)):
+            char = response[idx]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == "\\":
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return response[start_idx : idx + 1]
+
+        raise AIServiceError("Incomplete JSON object in AI response")
 
 
 class AIServiceError(Exception):
@@ -283,7 +418,7 @@ class AIServiceError(Exception):
 
 def create_ai_service() -> AIAnalysisService:
     """Factory function to create the appropriate AI service."""
-    if settings.google_api_key:
+    if get_settings().google_api_key:
         return GeminiAIService()
     else:
         raise ValueError("Google Gemini API key not configured")
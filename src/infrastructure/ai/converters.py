@@ -3,8 +3,9 @@ Data converters for AI service responses.
 Convert JSON responses to domain entities.
 """
 
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Deque, Dict, List, Optional
 
 from ...domain.entities import (
     CV,
@@ -18,153 +19,273 @@ from ...domain.entities import (
     SkillMatch,
 )
 
+# Skill levels keyed by their lowercase label, avoiding the Enum lookup
+# machinery for every converted skill.
+_LEVEL_LOOKUP: Dict[str, SkillLevel] = {
+    level.label: level for level in SkillLevel
+}
+_DEFAULT_LEVEL = SkillLevel.BEGINNER
 
-def convert_to_cv_entity(data: Dict[str, Any], raw_text: str) -> CV:
-    """Convert extracted data to CV entity."""
-    skills = []
-    for skill_data in data.get("skills", []):
-        try:
-            level_str = skill_data.get("level", "beginner").lower()
-            valid_levels = ["beginner", "intermediate", "advanced", "expert"]
-            if level_str not in valid_levels:
-                level_str = "beginner"
-
-            skill = Skill(
-                name=skill_data.get("name", ""),
-                level=SkillLevel(level_str),
-                years_experience=skill_data.get("years_experience"),
-                category=skill_data.get("category"),
-            )
-            skills.append(skill)
-        except (ValueError, TypeError):
-            continue
-
-    education = []
-    for edu_data in data.get("education", []):
-        edu = Education(
-            degree=edu_data.get("degree", ""),
-            institution=edu_data.get("institution", ""),
-            field_of_study=edu_data.get("field_of_study", ""),
-            graduation_year=edu_data.get("graduation_year"),
-        )
-        education.append(edu)
-
-    experience = []
-    for exp_data in data.get("experience", []):
-        exp = Experience(
-            position=exp_data.get("position", ""),
-            company=exp_data.get("company", ""),
-            duration_months=exp_data.get("duration_months", 0),
-            description=exp_data.get("description", ""),
-            skills_used=exp_data.get("skills_used", []),
+# Free-list of SkillMatch instances returned by release_skill_matches.
+# Matching builds and discards many of these per request, so reusing them
+# avoids allocator churn under sustained load.
+_SKILL_MATCH_POOL: Deque[SkillMatch] = deque(maxlen=1024)
+
+
+def _acquire_skill_match(
+    skill_name: str,
+    cv_has_skill: bool,
+    cv_skill_level: Optional[SkillLevel],
+    required_level: Optional[SkillLevel],
+    match_score: float,
+    gap_analysis: Optional[str],
+) -> SkillMatch:
+    """Get a SkillMatch from the pool, or create one if it is empty."""
+    try:
+        skill_match = _SKILL_MATCH_POOL.pop()
+    except IndexError:
+        return SkillMatch(
+            skill_name=skill_name,
+            cv_has_skill=cv_has_skill,
+            cv_skill_level=cv_skill_level,
+            required_level=required_level,
+            match_score=match_score,
+            gap_analysis=gap_analysis,
         )
-        experience.append(exp)
 
+    skill_match.skill_name = skill_name
+    skill_match.cv_has_skill = cv_has_skill
+    skill_match.cv_skill_level = cv_skill_level
+    skill_match.required_level = required_level
+    skill_match.match_score = match_score
+    skill_match.gap_analysis = gap_analysis
+    return skill_match
+
+
+def release_skill_matches(skill_matches: List[SkillMatch]) -> None:
+    """
+    Return SkillMatch objects to the pool once they are no longer needed.
+    The list is emptied so the released objects can't be reached through it.
+    """
+    _SKILL_MATCH_POOL.extend(skill_matches)
+    skill_matches.clear()
+
+
+def _to_level(
+    value: Any, default: Optional[SkillLevel] = _DEFAULT_LEVEL
+) -> Optional[SkillLevel]:
+    """Resolve an AI level string, falling back to default if unknown."""
+    if isinstance(value, str):
+        return _LEVEL_LOOKUP.get(value.lower(), default)
+    return default
+
+
+def _to_skill(skill_data: Dict[str, Any]) -> Optional[Skill]:
+    """Build a Skill from one AI record, or None if it is malformed."""
+    try:
+        get = skill_data.get
+    except AttributeError:
+        # The record itself is not a mapping
+        return None
+
+    return Skill(
+        name=get("name", ""),
+        level=_to_level(get("level")),
+        years_experience=get("years_experience"),
+        category=get("category"),
+    )
+
+
+def _to_education(edu_data: Dict[str, Any]) -> Education:
+    """Build an Education entry from one AI record."""
+    get = edu_data.get
+    return Education(
+        degree=get("degree", ""),
+        institution=get("institution", ""),
+        field_of_study=get("field_of_study", ""),
+        graduation_year=get("graduation_year"),
+    )
+
+
+def _to_experience(exp_data: Dict[str, Any]) -> Experience:
+    """Build an Experience entry from one AI record."""
+    get = exp_data.get
+    skills_used = get("skills_used")
+    return Experience(
+        position=get("position", ""),
+        company=get("company", ""),
+        duration_months=get("duration_months", 0),
+        description=get("description", ""),
+        skills_used=[] if skills_used is None else skills_used,
+    )
+
+
+def _to_required_skill(skill_data: Dict[str, Any]) -> Optional[JobRequirement]:
+    """Build a required JobRequirement, or None if it is malformed."""
+    try:
+        get = skill_data.get
+    except AttributeError:
+        # The record itself is not a mapping
+        return None
+
+    return JobRequirement(
+        skill=get("skill", ""),
+        required_level=_to_level(get("required_level")),
+        is_mandatory=get("is_mandatory", True),
+        weight=get("weight", 1.0),
+    )
+
+
+def _to_preferred_skill(
+    skill_data: Dict[str, Any]
+) -> Optional[JobRequirement]:
+    """Build a preferred JobRequirement, or None if it is malformed."""
+    try:
+        get = skill_data.get
+    except AttributeError:
+        # The record itself is not a mapping
+        return None
+
+    return JobRequirement(
+        skill=get("skill", ""),
+        required_level=_to_level(get("required_level")),
+        is_mandatory=False,
+        weight=get("weight", 0.5),
+    )
+
+
+def _to_skill_match(match_data: Dict[str, Any]) -> Optional[SkillMatch]:
+    """Build a (pooled) SkillMatch, or None if the record is malformed."""
+    try:
+        get = match_data.get
+    except AttributeError:
+        # The record itself is not a mapping
+        return None
+
+    # Level lookups are inlined here (see _to_level): skill matches are the
+    # largest lists the AI returns, so the extra calls add up.
+    cv_level = get("cv_skill_level")
+    req_level = get("required_level")
+    return _acquire_skill_match(
+        skill_name=get("skill_name", ""),
+        cv_has_skill=get("cv_has_skill", False),
+        cv_skill_level=(
+            _LEVEL_LOOKUP.get(cv_level.lower())
+            if isinstance(cv_level, str)
+            else None
+        ),
+        required_level=(
+            _LEVEL_LOOKUP.get(req_level.lower())
+            if isinstance(req_level, str)
+            else None
+        ),
+        match_score=get("match_score", 0.0),
+        gap_analysis=get("gap_analysis"),
+    )
+
+
+def _aggregate_skills_score(skill_matches: List[SkillMatch]) -> float:
+    """
+    Weighted mean of the per-skill match scores, on a 0-100 scale.
+    Skills with a higher required level weigh more; unknown levels count as
+    beginner. Used when the AI response has no skills_score of its own.
+    """
+    import numpy as np
+
+    count = len(skill_matches)
+    if not count:
+        return 0.0
+
+    scores = np.fromiter(
+        (match.match_score or 0.0 for match in skill_matches),
+        dtype=np.float64,
+        count=count,
+    )
+    weights = np.fromiter(
+        ((match.required_level or 0) + 1 for match in skill_matches),
+        dtype=np.float64,
+        count=count,
+    )
+    return float(np.dot(weights, scores) / weights.sum() * 100)
+
+
+def convert_to_cv_entity(
+    data: Dict[str, Any], raw_text: str, *, now: Optional[datetime] = None
+) -> CV:
+    """
+    Convert extracted data to CV entity.
+    Batch callers can pass one shared ``now`` as the creation timestamp.
+    """
     return CV(
         raw_text=raw_text,
         name=data.get("name"),
         email=data.get("email"),
         phone=data.get("phone"),
         location=data.get("location"),
-        skills=skills,
-        education=education,
-        experience=experience,
+        # Malformed records come back as None and are dropped by filter()
+        skills=list(filter(None, map(_to_skill, data.get("skills", [])))),
+        education=[_to_education(e) for e in data.get("education", [])],
+        experience=[_to_experience(e) for e in data.get("experience", [])],
         certifications=data.get("certifications", []),
         languages=data.get("languages", []),
-        created_at=datetime.now(),
+        created_at=now or datetime.now(),
     )
 
 
-def convert_to_job_entity(data: Dict[str, Any], description: str) -> Job:
-    """Convert extracted data to Job entity."""
-    required_skills = []
-    for skill_data in data.get("required_skills", []):
-        try:
-            level_str = skill_data.get("required_level", "beginner").lower()
-            valid_levels = ["beginner", "intermediate", "advanced", "expert"]
-            if level_str not in valid_levels:
-                level_str = "beginner"
-
-            req = JobRequirement(
-                skill=skill_data.get("skill", ""),
-                required_level=SkillLevel(level_str),
-                is_mandatory=skill_data.get("is_mandatory", True),
-                weight=skill_data.get("weight", 1.0),
-            )
-            required_skills.append(req)
-        except (ValueError, TypeError):
-            continue
-
-    preferred_skills = []
-    for skill_data in data.get("preferred_skills", []):
-        try:
-            level_str = skill_data.get("required_level", "beginner").lower()
-            valid_levels = ["beginner", "intermediate", "advanced", "expert"]
-            if level_str not in valid_levels:
-                level_str = "beginner"
-
-            req = JobRequirement(
-                skill=skill_data.get("skill", ""),
-                required_level=SkillLevel(level_str),
-                is_mandatory=False,
-                weight=skill_data.get("weight", 0.5),
-            )
-            preferred_skills.append(req)
-        except (ValueError, TypeError):
-            continue
-
+def convert_to_job_entity(
+    data: Dict[str, Any], description: str, *, now: Optional[datetime] = None
+) -> Job:
+    """
+    Convert extracted data to Job entity.
+    Batch callers can pass one shared ``now`` as the creation timestamp.
+    """
     return Job(
         title=data.get("title", ""),
         company=data.get("company", ""),
         description=description,
-        required_skills=required_skills,
-        preferred_skills=preferred_skills,
+        required_skills=list(
+            filter(
+                None, map(_to_required_skill, data.get("required_skills", []))
+            )
+        ),
+        preferred_skills=list(
+            filter(
+                None,
+                map(_to_preferred_skill, data.get("preferred_skills", [])),
+            )
+        ),
         min_experience_years=data.get("min_experience_years", 0),
         required_education=data.get("required_education", []),
         required_certifications=data.get("required_certifications", []),
         location=data.get("location"),
         salary_range=data.get("salary_range"),
-        created_at=datetime.now(),
+        created_at=now or datetime.now(),
     )
 
 
 def convert_to_match_analysis(
-    data: Dict[str, Any], cv_id: str, job_id: str
+    data: Dict[str, Any],
+    cv_id: str,
+    job_id: str,
+    *,
+    now: Optional[datetime] = None,
 ) -> MatchAnalysis:
-    """Convert match data to MatchAnalysis entity."""
-    skill_matches = []
-    for match_data in data.get("skill_matches", []):
-        try:
-            cv_level = match_data.get("cv_skill_level")
-            req_level = match_data.get("required_level")
-
-            valid_levels = ["beginner", "intermediate", "advanced", "expert"]
-            cv_skill_level = None
-            required_level = None
-
-            if cv_level and cv_level.lower() in valid_levels:
-                cv_skill_level = SkillLevel(cv_level.lower())
-
-            if req_level and req_level.lower() in valid_levels:
-                required_level = SkillLevel(req_level.lower())
-
-            skill_match = SkillMatch(
-                skill_name=match_data.get("skill_name", ""),
-                cv_has_skill=match_data.get("cv_has_skill", False),
-                cv_skill_level=cv_skill_level,
-                required_level=required_level,
-                match_score=match_data.get("match_score", 0.0),
-                gap_analysis=match_data.get("gap_analysis"),
-            )
-            skill_matches.append(skill_match)
-        except (ValueError, TypeError):
-            continue
+    """
+    Convert match data to MatchAnalysis entity.
+    Batch callers can pass one shared ``now`` as the analysis date.
+    """
+    skill_matches = list(
+        filter(None, map(_to_skill_match, data.get("skill_matches", [])))
+    )
+    skills_score = data.get("skills_score")
+    if skills_score is None:
+        skills_score = _aggregate_skills_score(skill_matches)
 
     return MatchAnalysis(
         cv_id=cv_id,
         job_id=job_id,
         overall_score=data.get("overall_score", 0.0),
-        skills_score=data.get("skills_score", 0.0),
+        skills_score=skills_score,
         experience_score=data.get("experience_score", 0.0),
         education_score=data.get("education_score", 0.0),
         skill_matches=skill_matches,
@@ -173,6 +294,6 @@ def convert_to_match_analysis(
         experience_gap_years=data.get("experience_gap_years", 0.0),
         recommendations=data.get("recommendations", []),
         interview_tips=data.get("interview_tips", []),
-        analysis_date=datetime.now(),
+        analysis_date=now or datetime.now(),
         ai_model_used="gemini-1.5-flash",
     )
@@ -1,137 +1,123 @@
 """
 AI prompts for CV analysis, job analysis, and matching.
+The static scaffolding of each prompt is built once at import time; only
+the request-specific text is inserted per call.
 """
 
+import orjson
 
-def create_cv_extraction_prompt(raw_text: str) -> str:
-    """Create prompt for CV data extraction."""
-    return f"""
+_CV_EXTRACTION_HEAD = """
 Extract structured information from this CV text and return as JSON.
 
 CV Text:
-{raw_text}
+"""
 
-Please extract and return ONLY a JSON object with this structure:
-{{
+_CV_EXTRACTION_TAIL = """
+
+Please extract and return a JSON object with this structure:
+{
     "name": "Full name",
     "email": "email@example.com",
     "phone": "phone number",
     "location": "city, country",
     "skills": [
-        {{
+        {
             "name": "Python",
             "level": "advanced",
             "years_experience": 3,
             "category": "programming"
-        }}
+        }
     ],
     "education": [
-        {{
+        {
             "degree": "Bachelor of Science",
             "institution": "University Name",
             "field_of_study": "Computer Science",
             "graduation_year": 2020
-        }}
+        }
     ],
     "experience": [
-        {{
+        {
             "position": "Software Developer",
             "company": "Company Name",
             "duration_months": 24,
             "description": "Job description",
             "skills_used": ["Python", "SQL"]
-        }}
+        }
     ],
     "certifications": ["AWS Certified"],
     "languages": ["English", "Spanish"]
-}}
+}
 
 Important:
 - Use skill levels: "beginner", "intermediate", "advanced", "expert"
 - Categories: "programming", "soft_skills", "tools", "domain_knowledge"
 - If information is missing, use null or empty arrays
 - Duration should be in months
-- Return ONLY the JSON, no additional text
 """
 
-
-def create_job_analysis_prompt(description: str) -> str:
-    """Create prompt for job description analysis."""
-    return f"""
+_JOB_ANALYSIS_HEAD = """
 Analyze this job description and extract requirements as JSON.
 
 Job Description:
-{description}
+"""
+
+_JOB_ANALYSIS_TAIL = """
 
-Please extract and return ONLY a JSON object with this structure:
-{{
+Please extract and return a JSON object with this structure:
+{
     "title": "Job Title",
     "company": "Company Name",
     "required_skills": [
-        {{
+        {
             "skill": "Python",
             "required_level": "advanced",
             "is_mandatory": true,
             "weight": 1.0
-        }}
+        }
     ],
     "preferred_skills": [
-        {{
+        {
             "skill": "Docker",
             "required_level": "intermediate",
             "is_mandatory": false,
             "weight": 0.5
-        }}
+        }
     ],
     "min_experience_years": 3,
     "required_education": ["Bachelor's degree in Computer Science"],
     "required_certifications": ["AWS Certified Developer"],
     "location": "San Francisco, CA",
     "salary_range": "$80,000 - $120,000"
-}}
+}
 
 Important:
 - Use skill levels: "beginner", "intermediate", "advanced", "expert"
 - Weight should be 0.1 to 1.0 (importance)
 - Separate mandatory vs preferred skills
 - If information is missing, use null or empty arrays
-- Return ONLY the JSON, no additional text
 """
 
-
-def create_matching_prompt(
-    cv_skills: list,
-    cv_experience: float,
-    job_skills: list,
-    job_experience: int,
-) -> str:
-    """Create prompt for CV-Job matching analysis."""
-    return f"""
+_MATCHING_HEAD = """
 Analyze how well this CV matches the job requirements.
+"""
 
-CV Summary:
-- Skills: {cv_skills}
-- Experience: {cv_experience} years
-
-Job Requirements:
-- Required Skills: {job_skills}
-- Minimum Experience: {job_experience} years
-
-Please analyze and return ONLY a JSON object with this structure:
-{{
+_MATCHING_TAIL = """
+Please analyze and return a JSON object with this structure:
+{
     "overall_score": 75.5,
     "skills_score": 80.0,
     "experience_score": 70.0,
     "education_score": 85.0,
     "skill_matches": [
-        {{
+        {
             "skill_name": "Python",
             "cv_has_skill": true,
             "cv_skill_level": "advanced",
             "required_level": "intermediate",
             "match_score": 0.9,
             "gap_analysis": "CV skill level exceeds requirements"
-        }}
+        }
     ],
     "missing_skills": ["Docker", "Kubernetes"],
     "matching_skills": ["Python", "SQL", "Git"],
@@ -144,12 +130,121 @@ Please analyze and return ONLY a JSON object with this structure:
         "Prepare examples of Python projects",
         "Show enthusiasm for learning new technologies"
     ]
-}}
+}
 
 Important:
 - Scores should be 0-100
 - match_score should be 0.0-1.0
 - Provide specific, actionable recommendations
 - Include realistic interview tips
-- Return ONLY the JSON, no additional text
 """
+
+_BATCH_MATCHING_HEAD = """
+Analyze how well each CV matches the job requirements it is paired with.
+"""
+
+_BATCH_MATCHING_TAIL = """
+Please analyze every pair and return a JSON object with this structure:
+{
+    "matches": [
+        {
+            "pair_id": 0,
+            "overall_score": 75.5,
+            "skills_score": 80.0,
+            "experience_score": 70.0,
+            "education_score": 85.0,
+            "skill_matches": [
+                {
+                    "skill_name": "Python",
+                    "cv_has_skill": true,
+                    "cv_skill_level": "advanced",
+                    "required_level": "intermediate",
+                    "match_score": 0.9,
+                    "gap_analysis": "CV skill level exceeds requirements"
+                }
+            ],
+            "missing_skills": ["Docker", "Kubernetes"],
+            "matching_skills": ["Python", "SQL", "Git"],
+            "experience_gap_years": 0.5,
+            "recommendations": [
+                "Learn Docker containerization",
+                "Gain experience with Kubernetes"
+            ],
+            "interview_tips": [
+                "Prepare examples of Python projects",
+                "Show enthusiasm for learning new technologies"
+            ]
+        }
+    ]
+}
+
+Important:
+- Return exactly one entry in "matches" per pair, with its pair_id
+- Scores should be 0-100
+- match_score should be 0.0-1.0
+- Provide specific, actionable recommendations
+- Include realistic interview tips
+"""
+
+
+def _json_list(values: list) -> str:
+    """Render a list as JSON for the model."""
+    return orjson.dumps(values).decode()
+
+
+def create_cv_extraction_prompt(raw_text: str) -> str:
+    """Create prompt for CV data extraction."""
+    return _CV_EXTRACTION_HEAD + raw_text + _CV_EXTRACTION_TAIL
+
+
+def create_job_analysis_prompt(description: str) -> str:
+    """Create prompt for job description analysis."""
+    return _JOB_ANALYSIS_HEAD + description + _JOB_ANALYSIS_TAIL
+
+
+def create_matching_prompt(
+    cv_skills: list,
+    cv_experience: float,
+    job_skills: list,
+    job_experience: int,
+) -> str:
+    """Create prompt for CV-Job matching analysis."""
+    return (
+        _MATCHING_HEAD
+        + f"""
+CV Summary:
+- Skills: {_json_list(cv_skills)}
+- Experience: {cv_experience} years
+
+Job Requirements:
+- Required Skills: {_json_list(job_skills)}
+- Minimum Experience: {job_experience} years
+"""
+        + _MATCHING_TAIL
+    )
+
+
+def create_batch_matching_prompt(pairs: list) -> str:
+    """
+    Create prompt for analyzing several CV-Job pairs in one request.
+    Each pair is a (cv_skills, cv_experience, job_skills, job_experience)
+    tuple and is identified in the response by its index.
+    """
+    pair_blocks = "\n".join(
+        f"""
+Pair {pair_id}:
+CV Summary:
+- Skills: {_json_list(cv_skills)}
+- Experience: {cv_experience} years
+Job Requirements:
+- Required Skills: {_json_list(job_skills)}
+- Minimum Experience: {job_experience} years
+"""
+        for pair_id, (
+            cv_skills,
+            cv_experience,
+            job_skills,
+            job_experience,
+        ) in enumerate(pairs)
+    )
+    return _BATCH_MATCHING_HEAD + pair_blocks + _BATCH_MATCHING_TAIL
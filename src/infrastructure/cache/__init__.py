@@ -0,0 +1,42 @@
+"""
+In-memory caching helpers.
+Used to skip repeated expensive work such as identical AI requests.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """Size-bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, marking it as recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -3,17 +3,23 @@ PDF processing implementation using pdfplumber and PyPDF2.
 This service extracts text content from uploaded PDF files.
 """
 
+import asyncio
 import io
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 import pdfplumber
 import PyPDF2
+from PyPDF2.errors import PdfReadError
 
 from ...domain.services import PDFProcessingService
 
 logger = logging.getLogger(__name__)
 
+# PDF writers may append whitespace or junk after the final %%EOF marker,
+# so look for it within this many trailing bytes.
+_EOF_SEARCH_WINDOW = 1024
+
 
 class PDFProcessor(PDFProcessingService):
     """Concrete implementation of PDF processing service."""
@@ -23,15 +29,71 @@ class PDFProcessor(PDFProcessingService):
         Extract text content from PDF file using multiple strategies.
         First tries pdfplumber, falls back to PyPDF2 if needed.
         """
+        return await self._extract_text(io.BytesIO(file_content))
+
+    async def validate_pdf_file(
+        self, file_content: bytes, strict: bool = False
+    ) -> bool:
+        """
+        Validate if the file is a proper PDF.
+        By default only the header and trailer markers are checked; pass
+        strict=True to also parse the document with PyPDF2.
+        """
+        if not self._has_pdf_markers(file_content):
+            return False
+        if not strict:
+            return True
+
+        reader = await asyncio.to_thread(
+            self._open_reader, io.BytesIO(file_content)
+        )
+        return reader is not None
+
+    async def process(self, file_content: bytes) -> Tuple[bool, str]:
+        """
+        Validate a PDF and extract its text from a single in-memory stream.
+        Only the cheap marker check runs up front; malformed documents are
+        caught by the extractors.
+        Returns (False, "") if the file is not a valid PDF.
+        """
+        if not self._has_pdf_markers(file_content):
+            return False, ""
+
+        return True, await self._extract_text(io.BytesIO(file_content))
+
+    @staticmethod
+    def _has_pdf_markers(file_content: bytes) -> bool:
+        """Check for the %PDF- header and a %%EOF marker near the end."""
+        return (
+            file_content.startswith(b"%PDF-")
+            and file_content.rfind(b"%%EOF", -_EOF_SEARCH_WINDOW) != -1
+        )
+
+    def _open_reader(
+        self, pdf_stream: io.BytesIO
+    ) -> Optional[PyPDF2.PdfReader]:
+        """Open a PyPDF2 reader if the content is a PDF with pages."""
+        try:
+            reader = PyPDF2.PdfReader(pdf_stream)
+
+            # Check if we can access basic properties
+            return reader if len(reader.pages) > 0 else None
+
+        except Exception as e:
+            logger.warning(f"PDF validation failed: {str(e)}")
+            return None
+
+    async def _extract_text(self, pdf_stream: io.BytesIO) -> str:
+        """Run the extraction strategies against one shared stream."""
         try:
             # Strategy 1: Try pdfplumber (better for complex layouts)
-            text = await self._extract_with_pdfplumber(file_content)
+            text = await self._extract_with_pdfplumber(pdf_stream)
             if text and text.strip():
                 logger.info("Successfully extracted text using pdfplumber")
                 return text
 
             # Strategy 2: Fallback to PyPDF2
-            text = await self._extract_with_pypdf2(file_content)
+            text = await self._extract_with_pypdf2(pdf_stream)
             if text and text.strip():
                 logger.info("Successfully extracted text using PyPDF2")
                 return text
@@ -44,57 +106,48 @@ class PDFProcessor(PDFProcessingService):
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise PDFProcessingError(f"Failed to extract text: {str(e)}")
 
-    async def validate_pdf_file(self, file_content: bytes) -> bool:
-        """Validate if the file is a proper PDF."""
-        try:
-            # Check PDF header
-            if not file_content.startswith(b"%PDF-"):
-                return False
-
-            # Try to open with PyPDF2 for basic validation
-            pdf_stream = io.BytesIO(file_content)
-            reader = PyPDF2.PdfReader(pdf_stream)
-
-            # Check if we can access basic properties
-            num_pages = len(reader.pages)
-
-            return num_pages > 0
-
-        except Exception as e:
-            logger.warning(f"PDF validation failed: {str(e)}")
-            return False
-
-    async def _extract_with_pdfplumber(self, file_content: bytes) -> str:
+    async def _extract_with_pdfplumber(self, pdf_stream: io.BytesIO) -> str:
         """Extract text using pdfplumber (better for tables and layouts)."""
-        try:
-            pdf_stream = io.BytesIO(file_content)
-            text_parts = []
+        # Parsing is CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(
+            self._extract_with_pdfplumber_sync, pdf_stream
+        )
 
+    def _extract_with_pdfplumber_sync(self, pdf_stream: io.BytesIO) -> str:
+        """Blocking pdfplumber extraction, run in a worker thread."""
+        try:
+            pdf_stream.seek(0)
             with pdfplumber.open(pdf_stream) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+                page_texts = [page.extract_text() for page in pdf.pages]
 
-            return "\n".join(text_parts)
+            return "\n".join(text for text in page_texts if text)
 
         except Exception as e:
             logger.debug(f"pdfplumber extraction failed: {str(e)}")
             return ""
 
-    async def _extract_with_pypdf2(self, file_content: bytes) -> str:
+    async def _extract_with_pypdf2(self, pdf_stream: io.BytesIO) -> str:
         """Extract text using PyPDF2 (fallback method)."""
+        return await asyncio.to_thread(
+            self._extract_with_pypdf2_sync, pdf_stream
+        )
+
+    def _extract_with_pypdf2_sync(self, pdf_stream: io.BytesIO) -> str:
+        """
+        Blocking PyPDF2 extraction, run in a worker thread.
+        Raises PdfReadError for malformed documents, since this is the last
+        strategy and the only one that can tell the caller the file is bad.
+        """
         try:
-            pdf_stream = io.BytesIO(file_content)
+            pdf_stream.seek(0)
             reader = PyPDF2.PdfReader(pdf_stream)
-            text_parts = []
 
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+            page_texts = [page.extract_text() for page in reader.pages]
+
+            return "\n".join(text for text in page_texts if text)
 
-            return "\n".join(text_parts)
+        except PdfReadError:
+            raise
 
         except Exception as e:
             logger.debug(f"PyPDF2 extraction failed: {str(e)}")
@@ -0,0 +1,30 @@
+"""
+Shared FastAPI dependencies for the API routes.
+"""
+
+from functools import lru_cache
+
+from fastapi import HTTPException
+
+from ...infrastructure.ai import create_ai_service
+from ...infrastructure.pdf import PDFProcessor
+
+
+@lru_cache(maxsize=1)
+def _ai_service_singleton():
+    """Create the AI service once so its client is reused across requests."""
+    return create_ai_service()
+
+
+def get_ai_service():
+    """Dependency to get AI service."""
+    try:
+        return _ai_service_singleton()
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@lru_cache(maxsize=1)
+def get_pdf_processor() -> PDFProcessor:
+    """Dependency to get PDF processor (stateless, so shared)."""
+    return PDFProcessor()
@@ -1,12 +1,17 @@
 """
 FastAPI application main module.
+Start the server with ``python main.py`` from the project root.
 """
 
+import hashlib
 import logging
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from ...config import settings
 from ..schemas import HealthResponse
@@ -19,11 +24,26 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Everything in the health response except the timestamp comes from
+# configuration, so it is computed once and used as the ETag. Probes that
+# send it back in If-None-Match get an empty 304 instead of a JSON body.
+# The tag is weak because the timestamp changes the body on every call.
+_AI_CONFIGURED = settings.is_ai_configured()
+_HEALTH_OPAQUE_TAG = '"{}"'.format(
+    hashlib.md5(
+        f"{settings.app_version}:{_AI_CONFIGURED}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+)
+_HEALTH_ETAG = f"W/{_HEALTH_OPAQUE_TAG}"
+_HEALTH_HEADERS = {"ETag": _HEALTH_ETAG, "Cache-Control": "no-cache"}
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="AI-powered CV analyzer for job matching",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -35,14 +55,38 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def create_upload_dir():
+    """Create the upload directory once instead of on every upload."""
+    Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
+
+
+def _health_etag_matches(if_none_match: str) -> bool:
+    """
+    Compare an If-None-Match header against the health ETag using weak
+    comparison (RFC 7232 section 3.2), so W/-prefixed tags also match.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == _HEALTH_OPAQUE_TAG:
+            return True
+    return False
+
+
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(
+    response: Response, if_none_match: Optional[str] = Header(None)
+):
     """Health check endpoint."""
-    return HealthResponse(
+    if if_none_match and _health_etag_matches(if_none_match):
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+
+    response.headers.update(_HEALTH_HEADERS)
+    return HealthResponse.model_construct(
         status="healthy",
         timestamp=datetime.now(),
         version=settings.app_version,
-        ai_service_configured=settings.is_ai_configured(),
+        ai_service_configured=_AI_CONFIGURED,
     )
 
 
@@ -62,14 +106,3 @@ app.include_router(job_router, prefix="/api/v1/job", tags=["Job Analysis"])
 app.include_router(
     match_router, prefix="/api/v1/match", tags=["CV-Job Matching"]
 )
-
-
-if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "src.presentation.api.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-    )
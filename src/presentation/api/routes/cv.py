@@ -2,33 +2,54 @@
 API routes for CV management.
 """
 
+import asyncio
+import hashlib
 import logging
-import os
 import uuid
+from functools import lru_cache
+from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 
-from ....config import settings
-from ....infrastructure.ai import AIServiceError, create_ai_service
+from ....config import get_settings
+from ....infrastructure.ai import AIServiceError
+from ....infrastructure.cache import LRUCache
 from ....infrastructure.pdf import PDFProcessingError, PDFProcessor
 from ...schemas import CVUploadResponse
+from ..dependencies import get_ai_service, get_pdf_processor
 
 logger = logging.getLogger(__name__)
 
 cv_router = APIRouter()
 
+# Uploads are read in chunks of this size so oversized files are rejected
+# before they are fully copied into memory.
+_UPLOAD_CHUNK_SIZE = 64 * 1024
 
-def get_pdf_processor():
-    """Dependency to get PDF processor."""
-    return PDFProcessor()
 
+@lru_cache(maxsize=1)
+def _get_upload_cache() -> LRUCache:
+    """
+    Responses for already analyzed uploads, keyed by a digest of the file
+    bytes, so re-uploading the same CV skips PDF parsing and the AI call.
+    """
+    return LRUCache(get_settings().upload_cache_size)
 
-def get_ai_service():
-    """Dependency to get AI service."""
-    try:
-        return create_ai_service()
-    except ValueError as e:
-        raise HTTPException(status_code=503, detail=str(e))
+
+async def _read_upload(file: UploadFile, limit: int) -> bytes:
+    """Read an uploaded file, raising 413 as soon as it exceeds limit."""
+    buffer = bytearray()
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=(
+                    f"File too large. Maximum size: "
+                    f"{get_settings().max_file_size_mb}MB"
+                ),
+            )
+    return bytes(buffer)
 
 
 @cv_router.post("/upload", response_model=CVUploadResponse)
@@ -41,6 +62,7 @@ async def upload_cv(
     Upload and analyze a CV file.
     Accepts PDF files and extracts structured data using AI.
     """
+    settings = get_settings()
     try:
         # Validate file type
         if not file.filename or not file.filename.lower().endswith(".pdf"):
@@ -48,49 +70,47 @@ async def upload_cv(
                 status_code=400, detail="Only PDF files are supported"
             )
 
-        # Read file content
-        file_content = await file.read()
+        # Read file content, enforcing the size limit while streaming
+        file_content = await _read_upload(file, settings.max_file_size_bytes)
 
-        # Validate file size
-        if len(file_content) > settings.max_file_size_bytes:
-            raise HTTPException(
-                status_code=413,
-                detail=(
-                    f"File too large. Maximum size: "
-                    f"{settings.max_file_size_mb}MB"
-                ),
-            )
+        digest = hashlib.blake2b(file_content, digest_size=16).hexdigest()
+        cached = _get_upload_cache().get(digest)
+        if cached is not None:
+            logger.info(f"Returning cached analysis for CV: {cached.id}")
+            # Same content and CV id, but echo this upload's filename
+            return cached.model_copy(update={"filename": file.filename})
 
-        # Validate PDF
-        if not await pdf_processor.validate_pdf_file(file_content):
+        # Validate PDF and extract its text in one pass
+        is_valid, raw_text = await pdf_processor.process(file_content)
+        if not is_valid:
             raise HTTPException(status_code=400, detail="Invalid PDF file")
 
-        # Extract text from PDF
-        raw_text = await pdf_processor.extract_text_from_pdf(file_content)
-
         if not raw_text.strip():
             raise HTTPException(
                 status_code=400, detail="Could not extract text from PDF"
             )
 
-        # Extract structured data using AI
-        cv = await ai_service.extract_cv_data(raw_text)
-        cv.id = str(uuid.uuid4())
-        cv.filename = file.filename
-
-        # Save file to uploads directory
-        if not os.path.exists(settings.upload_dir):
-            os.makedirs(settings.upload_dir)
-
-        file_path = os.path.join(
-            settings.upload_dir, f"{cv.id}_{file.filename}"
+        # Extract structured data using AI while saving the file to the
+        # uploads directory (created at startup)
+        cv_id = str(uuid.uuid4())
+        file_path = Path(settings.upload_dir) / f"{cv_id}_{file.filename}"
+        cv, write_error = await asyncio.gather(
+            ai_service.extract_cv_data(raw_text),
+            asyncio.to_thread(file_path.write_bytes, file_content),
+            return_exceptions=True,
         )
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        if isinstance(cv, BaseException):
+            await asyncio.to_thread(file_path.unlink, missing_ok=True)
+            raise cv
+        if isinstance(write_error, BaseException):
+            raise write_error
+
+        cv.id = cv_id
+        cv.filename = file.filename
 
         logger.info(f"Successfully processed CV: {cv.id}")
 
-        return CVUploadResponse(
+        response = CVUploadResponse.model_construct(
             id=cv.id,
             filename=cv.filename,
             message="CV uploaded and analyzed successfully",
@@ -98,7 +118,7 @@ async def upload_cv(
                 "name": cv.name,
                 "email": cv.email,
                 "skills": [
-                    {"name": s.name, "level": s.level.value} for s in cv.skills
+                    {"name": s.name, "level": s.level.label} for s in cv.skills
                 ],
                 "experience_years": cv.total_experience_years,
                 "education": [
@@ -108,6 +128,11 @@ async def upload_cv(
                 "certifications": cv.certifications,
             },
         )
+        _get_upload_cache().set(digest, response)
+        return response
+
+    except HTTPException:
+        raise
 
     except PDFProcessingError as e:
         logger.error(f"PDF processing error: {str(e)}")
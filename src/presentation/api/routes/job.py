@@ -7,22 +7,15 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from ....infrastructure.ai import AIServiceError, create_ai_service
+from ....infrastructure.ai import AIServiceError
 from ...schemas import JobAnalysisRequest, JobAnalysisResponse
+from ..dependencies import get_ai_service
 
 logger = logging.getLogger(__name__)
 
 job_router = APIRouter()
 
 
-def get_ai_service():
-    """Dependency to get AI service."""
-    try:
-        return create_ai_service()
-    except ValueError as e:
-        raise HTTPException(status_code=503, detail=str(e))
-
-
 @job_router.post("/analyze", response_model=JobAnalysisResponse)
 async def analyze_job_description(
     request: JobAnalysisRequest, ai_service=Depends(get_ai_service)
@@ -46,7 +39,7 @@ Job Description:
 
         logger.info(f"Successfully analyzed job: {job.id}")
 
-        return JobAnalysisResponse(
+        return JobAnalysisResponse.model_construct(
             id=job.id,
             title=job.title,
             company=job.company,
@@ -55,13 +48,13 @@ Job Description:
                 "required_skills": [
                     {
                         "skill": req.skill,
-                        "level": req.required_level.value,
+                        "level": req.required_level.label,
                         "mandatory": req.is_mandatory,
                     }
                     for req in job.required_skills
                 ],
                 "preferred_skills": [
-                    {"skill": req.skill, "level": req.required_level.value}
+                    {"skill": req.skill, "level": req.required_level.label}
                     for req in job.preferred_skills
                 ],
                 "min_experience_years": job.min_experience_years,
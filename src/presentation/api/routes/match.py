@@ -2,22 +2,29 @@
 API routes for CV-Job matching.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
+from typing import List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
-from ....infrastructure.ai import GeminiAIService
-from ...schemas import MatchRequest, MatchResponse
+from ...schemas import MatchCVJobRequest, MatchRequest, MatchResponse
+from ..dependencies import get_ai_service
 
 logger = logging.getLogger(__name__)
 
 match_router = APIRouter()
 
+# Upper bound on pairs per bulk request; each pair is one Gemini call.
+_MAX_BULK_MATCHES = 50
+
 
 @match_router.post("", response_model=dict)
-async def match_cv_job(request: dict):
+async def match_cv_job(
+    request: MatchCVJobRequest, ai_service=Depends(get_ai_service)
+):
     """
     Match a CV against a job description.
     Accepts CV and Job data directly and returns compatibility analysis.
@@ -25,17 +32,7 @@ async def match_cv_job(request: dict):
     try:
         logger.info("Processing CV-Job matching request")
 
-        cv_data = request.get("cv")
-        job_data = request.get("job")
-
-        if not cv_data or not job_data:
-            raise HTTPException(
-                status_code=400, detail="Both 'cv' and 'job' data are required"
-            )
-
-        ai_service = GeminiAIService()
-
-        match_analysis = await ai_service.match_cv_job(cv_data, job_data)
+        match_analysis = await ai_service.match_cv_job(request.cv, request.job)
 
         logger.info("Successfully completed CV-Job matching")
         return match_analysis
@@ -47,6 +44,37 @@ async def match_cv_job(request: dict):
         )
 
 
+@match_router.post("/bulk", response_model=List[dict])
+async def match_cv_job_bulk(
+    pairs: List[MatchCVJobRequest], ai_service=Depends(get_ai_service)
+):
+    """
+    Match several CV-Job pairs in one request.
+    The pairs are analyzed concurrently and returned in request order.
+    """
+    if len(pairs) > _MAX_BULK_MATCHES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {_MAX_BULK_MATCHES} pairs per request",
+        )
+
+    try:
+        logger.info(f"Processing {len(pairs)} CV-Job matching requests")
+
+        results = await asyncio.gather(
+            *(ai_service.match_cv_job(pair.cv, pair.job) for pair in pairs)
+        )
+
+        logger.info(f"Successfully completed {len(results)} CV-Job matches")
+        return results
+
+    except Exception as e:
+        logger.error(f"Error in bulk CV-Job matching: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Matching failed: {str(e)}"
+        )
+
+
 @match_router.post("/analyze", response_model=MatchResponse)
 async def create_match_analysis(request: MatchRequest):
     """
@@ -61,7 +89,7 @@ async def create_match_analysis(request: MatchRequest):
         f"Match analysis requested: CV {request.cv_id} vs Job {request.job_id}"
     )
 
-    return MatchResponse(
+    return MatchResponse.model_construct(
         id=str(uuid.uuid4()),
         cv_id=request.cv_id,
         job_id=request.job_id,
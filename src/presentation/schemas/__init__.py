@@ -43,6 +43,13 @@ class MatchRequest(BaseModel):
     job_id: str = Field(..., min_length=1)
 
 
+class MatchCVJobRequest(BaseModel):
+    """Request for matching raw CV data against raw job data."""
+
+    cv: dict = Field(..., min_length=1)
+    job: dict = Field(..., min_length=1)
+
+
 class SkillMatchDetail(BaseModel):
     """Detailed skill match information."""
 
@@ -0,0 +1,165 @@
+"""
+Tests for the Gemini AI service, run against a fake model.
+"""
+
+import orjson
+import pytest
+
+from src.domain.entities import CV, Job, JobRequirement, Skill, SkillLevel
+from src.infrastructure.ai import (
+    AIServiceError,
+    GeminiAIService,
+    _get_response_cache,
+)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModel:
+    """Returns the same JSON payload for every prompt."""
+
+    def __init__(self, payload: dict):
+        self._text = orjson.dumps(payload).decode()
+
+    async def generate_content_async(self, prompt: str) -> _FakeResponse:
+        return _FakeResponse(self._text)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    _get_response_cache().clear()
+    yield
+    _get_response_cache().clear()
+
+
+def _make_service(payload: dict) -> GeminiAIService:
+    # Bypass __init__ so no API key or SDK is needed
+    service = object.__new__(GeminiAIService)
+    service.model = _FakeModel(payload)
+    return service
+
+
+async def test_match_cv_job_reports_beginner_levels():
+    service = _make_service(
+        {
+            "overall_score": 50.0,
+            "skills_score": 50.0,
+            "experience_score": 50.0,
+            "skill_matches": [
+                {
+                    "skill_name": "Haskell",
+                    "cv_has_skill": True,
+                    "cv_skill_level": "beginner",
+                    "required_level": "beginner",
+                    "match_score": 1.0,
+                },
+                {
+                    "skill_name": "Elm",
+                    "cv_has_skill": False,
+                    "cv_skill_level": None,
+                    "required_level": "expert",
+                    "match_score": 0.0,
+                },
+            ],
+        }
+    )
+
+    result = await service.match_cv_job(
+        {"skills": [{"name": "Haskell"}]},
+        {"required_skills": [{"name": "Haskell"}, {"name": "Elm"}]},
+    )
+
+    assert result["matched_skills"] == [
+        {
+            "name": "Haskell",
+            "cv_level": "beginner",
+            "job_importance": "beginner",
+        },
+        {"name": "Elm", "cv_level": "unknown", "job_importance": "expert"},
+    ]
+
+
+def _pairs():
+    job = Job(required_skills=[JobRequirement("Go", SkillLevel.BEGINNER)])
+    return [
+        (CV(id="cv-0", skills=[Skill("Go", SkillLevel.EXPERT)]), job),
+        (CV(id="cv-1", skills=[]), job),
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # String ids, out of order
+        {
+            "matches": [
+                {"pair_id": "1", "overall_score": 10.0},
+                {"pair_id": "0", "overall_score": 90.0},
+            ]
+        },
+        # A bare list, plus entries that can't be mapped
+        [
+            "not a result",
+            {"pair_id": "first", "overall_score": 0.0},
+            {"pair_id": 0, "overall_score": 90.0},
+            {"pair_id": 1, "overall_score": 10.0},
+        ],
+    ],
+)
+async def test_calculate_match_scores_maps_results_to_pairs(payload):
+    service = _make_service(payload)
+
+    analyses = await service.calculate_match_scores(_pairs())
+
+    assert [(a.cv_id, a.overall_score) for a in analyses] == [
+        ("cv-0", 90.0),
+        ("cv-1", 10.0),
+    ]
+
+
+class _SequenceModel:
+    """Returns the given payloads in order and counts the calls."""
+
+    def __init__(self, *payloads):
+        self._texts = [orjson.dumps(payload).decode() for payload in payloads]
+        self.calls = 0
+
+    async def generate_content_async(self, prompt: str) -> _FakeResponse:
+        text = self._texts[min(self.calls, len(self._texts) - 1)]
+        self.calls += 1
+        return _FakeResponse(text)
+
+
+async def test_unusable_response_is_not_cached():
+    service = object.__new__(GeminiAIService)
+    service.model = _SequenceModel(["oops"], {"name": "Jane Doe"})
+
+    with pytest.raises(AIServiceError):
+        await service.extract_cv_data("Jane Doe, Python developer")
+    cv = await service.extract_cv_data("Jane Doe, Python developer")
+
+    assert cv.name == "Jane Doe"
+    assert service.model.calls == 2
+
+
+async def test_incomplete_batch_response_is_not_cached():
+    service = object.__new__(GeminiAIService)
+    service.model = _SequenceModel(
+        {"matches": [{"pair_id": 0, "overall_score": 90.0}]},
+        {
+            "matches": [
+                {"pair_id": 0, "overall_score": 90.0},
+                {"pair_id": 1, "overall_score": 10.0},
+            ]
+        },
+    )
+
+    with pytest.raises(AIServiceError):
+        await service.calculate_match_scores(_pairs())
+    analyses = await service.calculate_match_scores(_pairs())
+
+    assert len(analyses) == 2
+    assert service.model.calls == 2
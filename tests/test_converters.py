@@ -0,0 +1,79 @@
+"""
+Tests for converting AI JSON payloads into domain entities.
+"""
+
+from src.domain.entities import SkillLevel
+from src.infrastructure.ai.converters import (
+    convert_to_cv_entity,
+    convert_to_job_entity,
+    convert_to_match_analysis,
+)
+
+
+def test_cv_conversion_applies_defaults_and_skips_bad_records():
+    cv = convert_to_cv_entity(
+        {
+            "skills": [
+                "not a record",
+                {"name": "Python", "level": "Expert"},
+                {"name": "Go", "level": None},
+            ],
+            "experience": [{"position": "Dev"}],
+        },
+        "raw text",
+    )
+
+    assert [(s.name, s.level) for s in cv.skills] == [
+        ("Python", SkillLevel.EXPERT),
+        ("Go", SkillLevel.BEGINNER),
+    ]
+    assert cv.experience[0].company == ""
+    assert cv.experience[0].skills_used == []
+
+
+def test_job_conversion_applies_defaults_and_skips_bad_records():
+    job = convert_to_job_entity(
+        {
+            "required_skills": [42, {"skill": "SQL"}],
+            "preferred_skills": [
+                {"skill": "Docker", "required_level": "advanced"}
+            ],
+        },
+        "description",
+    )
+
+    required = job.required_skills[0]
+    assert len(job.required_skills) == 1
+    assert (required.skill, required.required_level) == (
+        "SQL",
+        SkillLevel.BEGINNER,
+    )
+    assert (required.is_mandatory, required.weight) == (True, 1.0)
+
+    preferred = job.preferred_skills[0]
+    assert preferred.required_level == SkillLevel.ADVANCED
+    assert (preferred.is_mandatory, preferred.weight) == (False, 0.5)
+
+
+def test_match_conversion_skips_bad_records():
+    analysis = convert_to_match_analysis(
+        {
+            "skills_score": 40.0,
+            "skill_matches": [
+                None,
+                {
+                    "skill_name": "Go",
+                    "cv_skill_level": 3,
+                    "required_level": "advanced",
+                },
+            ],
+        },
+        "cv",
+        "job",
+    )
+
+    (skill_match,) = analysis.skill_matches
+    assert skill_match.skill_name == "Go"
+    assert skill_match.cv_skill_level is None
+    assert skill_match.required_level == SkillLevel.ADVANCED
+    assert analysis.skills_score == 40.0
@@ -0,0 +1,67 @@
+"""
+Tests for the CV upload route, with the PDF and AI services faked.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import get_settings
+from src.domain.entities import CV, Skill, SkillLevel
+from src.presentation.api.dependencies import get_ai_service, get_pdf_processor
+from src.presentation.api.main import app
+from src.presentation.api.routes import cv as cv_routes
+
+
+class _FakePDFProcessor:
+    async def process(self, file_content: bytes):
+        return True, "Jane Doe, Python developer"
+
+
+class _FakeAIService:
+    def __init__(self):
+        self.calls = 0
+
+    async def extract_cv_data(self, raw_text: str) -> CV:
+        self.calls += 1
+        return CV(
+            raw_text=raw_text,
+            name="Jane Doe",
+            skills=[Skill("Python", SkillLevel.ADVANCED)],
+            education=[],
+            experience=[],
+            certifications=[],
+        )
+
+
+@pytest.fixture
+def ai_service(tmp_path, monkeypatch):
+    service = _FakeAIService()
+    monkeypatch.setattr(get_settings(), "upload_dir", str(tmp_path))
+    cv_routes._get_upload_cache.cache_clear()
+    app.dependency_overrides[get_ai_service] = lambda: service
+    app.dependency_overrides[get_pdf_processor] = _FakePDFProcessor
+    yield service
+    app.dependency_overrides.clear()
+    cv_routes._get_upload_cache.cache_clear()
+
+
+def _upload(client: TestClient, filename: str, content: bytes):
+    return client.post(
+        "/api/v1/cv/upload",
+        files={"file": (filename, content, "application/pdf")},
+    )
+
+
+def test_repeated_upload_reuses_analysis_with_new_filename(ai_service):
+    client = TestClient(app)
+    content = b"%PDF-1.4 same bytes %%EOF"
+
+    first = _upload(client, "a.pdf", content)
+    second = _upload(client, "b.pdf", content)
+
+    assert first.status_code == second.status_code == 200
+    assert ai_service.calls == 1
+    assert second.json()["id"] == first.json()["id"]
+    assert first.json()["filename"] == "a.pdf"
+    assert second.json()["filename"] == "b.pdf"
+    assert second.json()["extracted_data"] == first.json()["extracted_data"]
@@ -0,0 +1,45 @@
+"""
+Tests for the conditional /health endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.presentation.api.main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_health_sends_etag(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.parametrize(
+    "template",
+    ["{tag}", "W/{tag}", '"other", {tag}', '"other", W/{tag}', "*"],
+)
+def test_health_matching_etag_returns_304(client, template):
+    etag = client.get("/health").headers["etag"]
+    tag = etag.removeprefix("W/")
+
+    response = client.get(
+        "/health", headers={"If-None-Match": template.format(tag=tag)}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_health_stale_etag_returns_200(client):
+    response = client.get("/health", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
@@ -0,0 +1,46 @@
+"""
+Tests for the CV-Job matching routes, with the AI service faked.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.presentation.api.dependencies import get_ai_service
+from src.presentation.api.main import app
+
+
+class _FakeAIService:
+    async def match_cv_job(self, cv_data: dict, job_data: dict) -> dict:
+        # Finish later calls first so ordering is actually exercised
+        await asyncio.sleep(0.01 / cv_data["rank"])
+        return {"cv": cv_data["rank"], "job": job_data["title"]}
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_ai_service] = _FakeAIService
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _pair(rank: int) -> dict:
+    return {"cv": {"rank": rank}, "job": {"title": f"Job {rank}"}}
+
+
+def test_bulk_match_returns_results_in_request_order(client):
+    response = client.post(
+        "/api/v1/match/bulk", json=[_pair(1), _pair(2), _pair(3)]
+    )
+
+    assert response.status_code == 200
+    assert [result["cv"] for result in response.json()] == [1, 2, 3]
+
+
+def test_bulk_match_rejects_oversized_batches(client):
+    response = client.post(
+        "/api/v1/match/bulk", json=[_pair(1) for _ in range(51)]
+    )
+
+    assert response.status_code == 400
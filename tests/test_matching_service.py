@@ -0,0 +1,86 @@
+"""
+Tests for the MatchingService business rules.
+"""
+
+import copy
+import random
+
+import pytest
+
+from src.domain.entities import (
+    CV,
+    Education,
+    Experience,
+    Job,
+    JobRequirement,
+    MatchAnalysis,
+    Skill,
+    SkillLevel,
+)
+from src.domain.services import MatchingService
+
+SKILL_NAMES = ["Python", "Go", "SQL", "Docker", "Rust"]
+
+
+def _random_job(rng: random.Random) -> Job:
+    return Job(
+        required_skills=[
+            JobRequirement(
+                name, SkillLevel.BEGINNER, is_mandatory=rng.random() < 0.6
+            )
+            for name in rng.sample(SKILL_NAMES, 3)
+        ],
+        min_experience_years=rng.randint(0, 6),
+        required_education=rng.choice([[], ["BSc"], ["PhD"]]),
+    )
+
+
+def _random_cv(rng: random.Random) -> CV:
+    return CV(
+        skills=[
+            Skill(name, SkillLevel.BEGINNER)
+            for name in rng.sample(SKILL_NAMES, rng.randint(0, 5))
+        ],
+        experience=[Experience("Dev", "Acme", rng.randint(0, 120), "", [])],
+        education=[Education("BSc", "Uni", "CS")],
+    )
+
+
+def _random_analysis(rng: random.Random) -> MatchAnalysis:
+    return MatchAnalysis(
+        cv_id="cv",
+        job_id="job",
+        overall_score=rng.uniform(-5, 105),
+        missing_skills=rng.choice([[], ["Kotlin"]]),
+        experience_gap_years=rng.choice([0, 1.5]),
+        recommendations=[],
+    )
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_batch_rules_match_scalar_rules(seed):
+    rng = random.Random(seed)
+    service = MatchingService(ai_service=None)
+    job = _random_job(rng)
+    cvs = [_random_cv(rng) for _ in range(5)]
+    analyses = [_random_analysis(rng) for _ in cvs]
+
+    scalar = [
+        service._apply_business_rules(copy.deepcopy(analysis), cv, job)
+        for analysis, cv in zip(analyses, cvs)
+    ]
+    batch = service.batch_apply_business_rules(
+        copy.deepcopy(analyses), cvs, job
+    )
+
+    assert [a.overall_score for a in batch] == pytest.approx(
+        [a.overall_score for a in scalar]
+    )
+    assert [a.recommendations for a in batch] == [
+        a.recommendations for a in scalar
+    ]
+
+
+def test_batch_rules_empty_batch():
+    service = MatchingService(ai_service=None)
+    assert service.batch_apply_business_rules([], [], Job()) == []